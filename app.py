@@ -1,44 +1,116 @@
+# Must run before anything imports socket/ssl, or the outbound LLM/db
+# calls stay blocking and serialize the gevent hub.
+from gevent import monkey
+monkey.patch_all()
+
 from dotenv import load_dotenv
 load_dotenv()
 
+import datetime
+import functools
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from flask import Flask, jsonify, Response, request, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 import flask
+import orjson
 import os
 from cache import MemoryCache
 import db
+import sql_cache
 from flasgger import Swagger
+from flask_caching import Cache as ResponseCache
+from flask_compress import Compress
+
+class ORJSONProvider(DefaultJSONProvider):
+    def default(self, o):
+        # to_dict(orient='records') leaks pandas scalars into the
+        # payload: NaT/NA must become null, and datetimes that orjson
+        # punts on should stay ISO-8601 rather than Flask's HTTP-date.
+        import pandas as pd
+
+        try:
+            if pd.isna(o):
+                return None
+        except (TypeError, ValueError):
+            pass
+
+        if isinstance(o, datetime.date):
+            return o.isoformat()
+
+        return super().default(o)
+
+    def dumps(self, obj, **kwargs):
+        # Keep the provider's default= fallback: orjson raises on types
+        # Flask otherwise handles, e.g. Decimal from Snowflake NUMBERs.
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__, static_url_path='')
-swagger = Swagger(app)
+app.json = ORJSONProvider(app)
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/csv', 'text/html']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_MIN_SIZE'] = 512
+Compress(app)
+
+if os.getenv("FLASK_ENV") == "production" and os.path.isfile(os.path.join(app.static_folder, 'apispec.json')):
+    # Serve the spec precomputed by `make apispec` instead of paying
+    # flasgger's docstring introspection and YAML parsing per request.
+    @app.route('/apispec_1.json')
+    def apispec():
+        return app.send_static_file('apispec.json')
+else:
+    # Fall back to live flasgger when the static spec hasn't been
+    # generated, rather than 404ing the spec endpoint.
+    swagger = Swagger(app)
 
 # SETUP
 cache = MemoryCache()
+rcache = ResponseCache(app, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 600})
+executor = ThreadPoolExecutor(max_workers=int(os.getenv("LLM_MAX_WORKERS", 32)))
 
 # from vanna.local import LocalContext_OpenAI
 # vn = LocalContext_OpenAI()
 
-from vanna.remote import VannaDefault
-vn = VannaDefault(model=os.environ['VANNA_MODEL'], api_key=os.environ['VANNA_API_KEY'])
+class _LazyVn:
+    # Defers the vanna import, client construction and db connection to
+    # first use, so workers start fast and idle ones never pay for it.
+    _inst = None
+    _lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if _LazyVn._inst is None:
+            with _LazyVn._lock:
+                if _LazyVn._inst is None:
+                    from vanna.remote import VannaDefault
+                    inst = VannaDefault(model=os.environ['VANNA_MODEL'], api_key=os.environ['VANNA_API_KEY'])
+                    db.connect(vn=inst)
+                    _LazyVn._inst = inst
+
+        return getattr(_LazyVn._inst, name)
 
-db.connect(vn=vn)
+vn = _LazyVn()
 
 # NO NEED TO CHANGE ANYTHING BELOW THIS LINE
 def requires_cache(fields):
     def decorator(f):
         @wraps(f)
         def decorated(*args, **kwargs):
-            id = request.args.get('id')
-
-            if id is None:
+            try:
+                id = request.args['id']
+            except KeyError:
                 return jsonify({"type": "error", "error": "No id provided"})
-            
-            for field in fields:
-                if cache.get(id=id, field=field) is None:
-                    return jsonify({"type": "error", "error": f"No {field} found"})
-            
-            field_values = {field: cache.get(id=id, field=field) for field in fields}
-            
+
+            field_values = cache.get_many(id=id, fields=fields)
+
+            if field_values is None:
+                return jsonify({"type": "error", "error": f"No {' / '.join(fields)} found"})
+
             # Add the id to the field_values
             field_values['id'] = id
 
@@ -46,7 +118,49 @@ def requires_cache(fields):
         return decorated
     return decorator
 
+ARROW_MIMETYPE = 'application/vnd.apache.arrow.stream'
+
+def _arrow_response(df, id):
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return Response(
+        sink.getvalue().to_pybytes(),
+        mimetype=ARROW_MIMETYPE,
+        headers={'X-Result-Id': id})
+
+def _wants_arrow():
+    # Require the client to name the Arrow type explicitly: best_match
+    # would resolve a plain */* (curl, the bundled frontend) to whichever
+    # candidate is listed first, not to JSON.
+    return ARROW_MIMETYPE in request.headers.get('Accept', '')
+
+def _normalize_question(question: str) -> str:
+    # Lowercase, collapse whitespace and drop trailing punctuation so
+    # trivially different phrasings share a cache id.
+    return re.sub(r'[\s?!.]+$', '', re.sub(r'\s+', ' ', question.strip().lower()))
+
+@rcache.memoize(600)
+def _generate_sql(question: str) -> str:
+    return vn.generate_sql(question=question)
+
+def _generate_sql_cached(norm: str, question: str) -> str:
+    # Check the durable sqlite cache before paying for the LLM; store
+    # fresh generations so repeat questions stay warm across restarts.
+    sql = sql_cache.lookup(norm)
+
+    if sql is None:
+        sql = _generate_sql(question)
+        sql_cache.store(norm, sql)
+
+    return sql
+
 @app.route('/api/v0/generate_questions', methods=['GET'])
+@rcache.cached(timeout=600, query_string=True)
 def generate_questions():
     """
     Generate a list of questions that can be asked based on the current context.
@@ -104,19 +218,78 @@ def generate_sql():
     if question is None:
         return jsonify({"type": "error", "error": "No question provided"})
 
-    id = cache.generate_id(question=question)
-    sql = vn.generate_sql(question=question)
+    norm = _normalize_question(question)
+    id = cache.generate_id(question=norm)
+    cache.append_history(id=id, question=question)
+
+    # Read-through: a normalized duplicate of an earlier question skips
+    # the LLM entirely.
+    sql = cache.get(id=id, field='sql')
+    if sql is not None:
+        return jsonify({"type": "sql", "id": id, "text": sql})
 
     cache.set(id=id, field='question', value=question)
+
+    if flask.request.args.get('async') == 'true':
+        # Don't hold the worker thread on the LLM round-trip; the client
+        # collects the result via /api/v0/poll.
+        cache.set(id=id, field='sql_future', value=executor.submit(_generate_sql_cached, norm, question))
+
+        return jsonify({"type": "sql_pending", "id": id, "status": "pending"})
+
+    sql = _generate_sql_cached(norm, question)
+
     cache.set(id=id, field='sql', value=sql)
 
     return jsonify(
         {
-            "type": "sql", 
+            "type": "sql",
             "id": id,
             "text": sql,
         })
 
+@app.route('/api/v0/poll', methods=['GET'])
+def poll():
+    """
+    Poll for the result of an async generate_sql request.
+    ---
+    parameters:
+        - name: id
+          in: query
+          type: string
+          required: true
+          description: The ID returned by generate_sql?async=true.
+    responses:
+        200:
+            description: The generated SQL.
+        202:
+            description: The SQL is still being generated.
+    """
+    id = flask.request.args.get('id')
+
+    if id is None:
+        return jsonify({"type": "error", "error": "No id provided"})
+
+    sql = cache.get(id=id, field='sql')
+    if sql is not None:
+        return jsonify({"type": "sql", "id": id, "text": sql})
+
+    future = cache.get(id=id, field='sql_future')
+    if future is None:
+        return jsonify({"type": "error", "error": "No pending request found"})
+
+    if not future.done():
+        return jsonify({"type": "sql_pending", "id": id, "status": "pending"}), 202
+
+    try:
+        sql = future.result()
+    except Exception as e:
+        return jsonify({"type": "error", "error": str(e)})
+
+    cache.set(id=id, field='sql', value=sql)
+
+    return jsonify({"type": "sql", "id": id, "text": sql})
+
 @app.route('/api/v0/run_sql', methods=['GET'])
 @requires_cache(['sql'])
 def run_sql(id: str, sql: str):
@@ -149,13 +322,22 @@ def run_sql(id: str, sql: str):
     try:
         df = vn.run_sql(sql=sql)
 
+        # Materialize the preview rows once; the frame is immutable in
+        # cache, so load_question can serve them verbatim.
+        head_records = df.head(10).to_dict(orient='records')
+
         cache.set(id=id, field='df', value=df)
+        cache.set(id=id, field='df_head', value=head_records)
+        cache.set(id=id, field='df_meta', value=_dtypes_signature(df))
+
+        if _wants_arrow():
+            return _arrow_response(df, id)
 
         return jsonify(
             {
-                "type": "df", 
+                "type": "df",
                 "id": id,
-                "df": df.head(10).to_json(orient='records'),
+                "df": head_records,
             })
 
     except Exception as e:
@@ -188,17 +370,33 @@ def download_csv(id: str, df):
                         type: string
                         example: "name,age\nJohn,30\nJane,25"
     """
-    csv = df.to_csv()
+    def generate(chunk_size=10_000):
+        # Header row first, then the frame in chunks so the response
+        # streams instead of materializing the whole CSV in memory.
+        yield df.iloc[:0].to_csv(index=False)
+
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size].to_csv(index=False, header=False)
 
     return Response(
-        csv,
+        generate(),
         mimetype="text/csv",
         headers={"Content-disposition":
                  f"attachment; filename={id}.csv"})
 
+def _dtypes_signature(df) -> str:
+    # Canonical, order-independent schema fingerprint: re-running the
+    # same sql against fresher rows yields the same signature.
+    return str(sorted(df.dtypes.astype(str).to_dict().items()))
+
+@functools.lru_cache(maxsize=512)
+def _generate_plotly_code(question, sql, dtypes_sig):
+    return vn.generate_plotly_code(question=question, sql=sql,
+                                   df_metadata=f"Running df.dtypes gives:\n{dtypes_sig}")
+
 @app.route('/api/v0/generate_plotly_figure', methods=['GET'])
-@requires_cache(['df', 'question', 'sql'])
-def generate_plotly_figure(id: str, df, question, sql):
+@requires_cache(['df', 'question', 'sql', 'df_meta'])
+def generate_plotly_figure(id: str, df, question, sql, df_meta):
     """
     Generate a Plotly figure based on the question and SQL query.
     ---
@@ -224,17 +422,19 @@ def generate_plotly_figure(id: str, df, question, sql):
                         example: {"data": [{"x": [1, 2, 3], "y": [4, 5, 6]}]}
     """
     try:
-        code = vn.generate_plotly_code(question=question, sql=sql, df_metadata=f"Running df.dtypes gives:\n {df.dtypes}")
+        code = _generate_plotly_code(question, sql, df_meta)
         fig = vn.get_plotly_figure(plotly_code=code, df=df, dark_mode=False)
-        fig_json = fig.to_json()
+        # Keep the dict form so the outer response encoder emits the
+        # figure once instead of string-escaping pre-serialized JSON.
+        fig_dict = orjson.loads(fig.to_json())
 
-        cache.set(id=id, field='fig_json', value=fig_json)
+        cache.set(id=id, field='fig_json', value=fig_dict)
 
         return jsonify(
             {
-                "type": "plotly_figure", 
+                "type": "plotly_figure",
                 "id": id,
-                "fig": fig_json,
+                "fig": fig_dict,
             })
     except Exception as e:
         # Print the stack trace
@@ -244,6 +444,7 @@ def generate_plotly_figure(id: str, df, question, sql):
         return jsonify({"type": "error", "error": str(e)})
 
 @app.route('/api/v0/get_training_data', methods=['GET'])
+@rcache.cached(timeout=600)
 def get_training_data():
     """
     Get the training data from the database.
@@ -272,7 +473,7 @@ def get_training_data():
     {
         "type": "df", 
         "id": "training_data",
-        "df": df.head(25).to_json(orient='records'),
+        "df": df.head(25).to_dict(orient='records'),
     })
 
 @app.route('/api/v0/remove_training_data', methods=['POST'])
@@ -300,12 +501,14 @@ def remove_training_data():
                         example: "Couldn't remove training data"
     """
     # Get id from the JSON body
-    id = flask.request.json.get('id')
+    payload = flask.request.get_json(cache=True) or {}
+    id = payload.get('id')
 
     if id is None:
         return jsonify({"type": "error", "error": "No id provided"})
 
     if vn.remove_training_data(id=id):
+        rcache.delete('view//api/v0/get_training_data')
         return jsonify({"success": True})
     else:
         return jsonify({"type": "error", "error": "Couldn't remove training data"})
@@ -349,19 +552,63 @@ def add_training_data():
                         type: string
                         example: Could not train the model
     """
-    question = flask.request.json.get('question')
-    sql = flask.request.json.get('sql')
-    ddl = flask.request.json.get('ddl')
-    documentation = flask.request.json.get('documentation')
+    # Decode the body once instead of re-touching request.json per field
+    payload = flask.request.get_json(cache=True) or {}
+    question = payload.get('question')
+    sql = payload.get('sql')
+    ddl = payload.get('ddl')
+    documentation = payload.get('documentation')
 
     try:
         id = vn.train(question=question, sql=sql, ddl=ddl, documentation=documentation)
 
+        rcache.delete('view//api/v0/get_training_data')
+
         return jsonify({"id": id})
     except Exception as e:
         print("TRAINING ERROR", e)
         return jsonify({"type": "error", "error": str(e)})
 
+@app.route('/api/v0/train/batch', methods=['POST'])
+def add_training_batch():
+    """
+    Add multiple training data items in one request.
+    ---
+    parameters:
+        - name: items
+          in: body
+          type: array
+          required: true
+          description: A list of training items, each with any of question, sql, ddl, documentation.
+    responses:
+        200:
+            description: The result of the training.
+            schema:
+                type: object
+                properties:
+                    ids:
+                        type: array
+                        items:
+                            type: string
+                        example: ["12345", "67890"]
+                    error:
+                        type: string
+                        example: Could not train the model
+    """
+    items = flask.request.get_json(cache=True) or []
+
+    try:
+        # Fan the remote calls out over the shared executor so N items
+        # cost roughly one round-trip instead of N.
+        ids = list(executor.map(lambda item: vn.train(**item), items))
+
+        rcache.delete('view//api/v0/get_training_data')
+
+        return jsonify({"ids": ids})
+    except Exception as e:
+        print("TRAINING ERROR", e)
+        return jsonify({"type": "error", "error": str(e)})
+
 @app.route('/api/v0/generate_followup_questions', methods=['GET'])
 @requires_cache(['df', 'question', 'sql'])
 def generate_followup_questions(id: str, df, question, sql):
@@ -405,8 +652,8 @@ def generate_followup_questions(id: str, df, question, sql):
         })
 
 @app.route('/api/v0/load_question', methods=['GET'])
-@requires_cache(['question', 'sql', 'df', 'fig_json', 'followup_questions'])
-def load_question(id: str, question, sql, df, fig_json, followup_questions):
+@requires_cache(['question', 'sql', 'df_head', 'fig_json', 'followup_questions'])
+def load_question(id: str, question, sql, df_head, fig_json, followup_questions):
     """
     Load a question based on the ID provided.
     ---
@@ -448,13 +695,18 @@ def load_question(id: str, question, sql, df, fig_json, followup_questions):
                         example: ["What is the average salary?", "How many employees are there?"]
     """
     try:
+        if _wants_arrow():
+            df = cache.get(id=id, field='df')
+            if df is not None:
+                return _arrow_response(df, id)
+
         return jsonify(
             {
-                "type": "question_cache", 
+                "type": "question_cache",
                 "id": id,
                 "question": question,
                 "sql": sql,
-                "df": df.head(10).to_json(orient='records'),
+                "df": df_head,
                 "fig": fig_json,
                 "followup_questions": followup_questions,
             })
@@ -482,11 +734,17 @@ def get_question_history():
                             type: string
                         example: ["What is the average salary?", "How many employees are there?"]
     """
-    return jsonify({"type": "question_history", "questions": cache.get_all(field_list=['question']) })
+    return jsonify({"type": "question_history", "questions": cache.get_history() })
 
 @app.route('/')
 def root():
     return app.send_static_file('index.html')
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    if os.getenv("FLASK_DEBUG") == "1":
+        app.run(debug=True, threaded=True)
+    else:
+        # Cooperative scheduling: the outbound LLM/db waits yield the
+        # greenlet, so one process handles many concurrent requests.
+        from gevent.pywsgi import WSGIServer
+        WSGIServer(('0.0.0.0', 5000), app).serve_forever()
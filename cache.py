@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
+import os
+import threading
+import time
 import uuid
+from collections import OrderedDict, deque
 
 class Cache(ABC):
     @abstractmethod
@@ -24,39 +28,215 @@ class Cache(ABC):
 
 
 class MemoryCache(Cache):
-    def __init__(self):
-        self.cache = {}
+    def __init__(self, max_entries=None, ttl_seconds=None, max_memory_mb=None):
+        # Bounded LRU with per-entry TTL so long-running workers don't
+        # accumulate every question/df ever asked.
+        self.max_entries = int(max_entries if max_entries is not None else os.getenv("CACHE_MAX_ENTRIES", 512))
+        self.ttl_seconds = float(ttl_seconds if ttl_seconds is not None else os.getenv("CACHE_TTL_SECONDS", 3600))
+        self.max_memory_mb = float(max_memory_mb if max_memory_mb is not None else os.getenv("CACHE_MAX_MEMORY_MB", 256))
+        self.compact_after = float(os.getenv("CACHE_COMPACT_AFTER", 120))
+        self.compact_interval = float(os.getenv("CACHE_COMPACT_INTERVAL", 60))
+        self.cache = OrderedDict()
+        self._history = deque(maxlen=int(os.getenv("CACHE_HISTORY_MAX", 500)))
+        self._lock = threading.Lock()
+        self._compactor = threading.Thread(target=self._compact_loop, daemon=True)
+        self._compactor.start()
 
     def generate_id(self, *args, **kwargs):
+        question = kwargs.get("question")
+
+        if question is not None:
+            # Deterministic, so the same (normalized) question maps to
+            # the same entry and repeat asks hit the cache.
+            return str(uuid.uuid5(uuid.NAMESPACE_URL, question))
+
         return str(uuid.uuid4())
 
+    def _value_bytes(self, field, value):
+        if field == "df":
+            try:
+                return int(value.memory_usage(deep=True).sum())
+            except AttributeError:
+                pass
+        return len(str(value))
+
+    def _total_bytes(self):
+        return sum(entry["size_bytes"] for entry in self.cache.values())
+
+    def _evict_one(self):
+        # v-LRU: consider the coldest 10% of entries and, among them,
+        # evict the one with the most bytes per hit so a large stale
+        # DataFrame goes before a small recently-asked question.
+        candidates = list(self.cache.items())[: max(1, len(self.cache) // 10)]
+        id, _ = max(
+            candidates,
+            key=lambda kv: kv[1]["size_bytes"] / (1 + kv[1]["hits"]),
+        )
+        self.cache.pop(id, None)
+
+    def _evict_if_needed(self):
+        # Called with the lock held, after an insert.
+        while len(self.cache) > self.max_entries:
+            self._evict_one()
+
+        max_bytes = self.max_memory_mb * 1024 * 1024
+        while len(self.cache) > 1 and self._total_bytes() > max_bytes:
+            self._evict_one()
+
     def set(self, id, field, value):
-        if id not in self.cache:
-            self.cache[id] = {}
+        with self._lock:
+            entry = self.cache.get(id)
+
+            if entry is None:
+                entry = {"fields": {}, "sizes": {}, "expires_at": 0, "hits": 0, "size_bytes": 0,
+                         "last_access": 0, "df_compressed": False}
+                self.cache[id] = entry
 
-        self.cache[id][field] = value
+            entry["fields"][field] = value
+            entry["sizes"][field] = self._value_bytes(field, value)
+            entry["size_bytes"] = sum(entry["sizes"].values())
+            entry["expires_at"] = time.monotonic() + self.ttl_seconds
+            entry["last_access"] = time.monotonic()
+            if field == "df":
+                entry["df_compressed"] = False
+            self.cache.move_to_end(id, last=True)
+
+            self._evict_if_needed()
 
     def get(self, id, field):
-        if id not in self.cache:
-            return None
+        with self._lock:
+            entry = self.cache.get(id)
+
+            if entry is None:
+                return None
+
+            if time.monotonic() >= entry["expires_at"]:
+                self.cache.pop(id, None)
+                return None
+
+            entry["hits"] += 1
+            entry["last_access"] = time.monotonic()
+            self.cache.move_to_end(id, last=True)
+
+            if field == "df" and entry["df_compressed"]:
+                return self._decompress_df(entry)
+
+            return entry["fields"].get(field)
+
+    def get_many(self, id, fields):
+        # One lookup (and one hit) for a batch of fields; returns None
+        # if the entry is missing, expired, or lacks any of the fields.
+        with self._lock:
+            entry = self.cache.get(id)
+
+            if entry is None:
+                return None
+
+            if time.monotonic() >= entry["expires_at"]:
+                self.cache.pop(id, None)
+                return None
+
+            values = {}
+            for field in fields:
+                if field == "df" and entry["df_compressed"]:
+                    values[field] = self._decompress_df(entry)
+                    continue
+
+                value = entry["fields"].get(field)
+                if value is None:
+                    return None
+                values[field] = value
+
+            entry["hits"] += 1
+            entry["last_access"] = time.monotonic()
+            self.cache.move_to_end(id, last=True)
+
+            return values
+
+    def _decompress_df(self, entry):
+        # Rehydrate in place; the compactor will re-compress once the
+        # entry goes cold again.
+        import pyarrow as pa
+
+        df = pa.ipc.deserialize_pandas(pa.py_buffer(entry["fields"]["df"]))
+        entry["fields"]["df"] = df
+        entry["df_compressed"] = False
+        entry["sizes"]["df"] = self._value_bytes("df", df)
+        entry["size_bytes"] = sum(entry["sizes"].values())
+        return df
+
+    def _cold(self, entry, now):
+        return (not entry["df_compressed"]
+                and entry["fields"].get("df") is not None
+                and now - entry["last_access"] >= self.compact_after)
+
+    def _compact_loop(self):
+        while True:
+            time.sleep(self.compact_interval)
+
+            with self._lock:
+                now = time.monotonic()
+                candidates = [id for id, entry in self.cache.items() if self._cold(entry, now)]
+
+            for id in candidates:
+                # One entry per lock acquisition, with the Arrow
+                # serialization done outside the lock so request paths
+                # never wait behind a multi-frame compression pass.
+                with self._lock:
+                    entry = self.cache.get(id)
+                    if entry is None or not self._cold(entry, time.monotonic()):
+                        continue
+                    df = entry["fields"]["df"]
+
+                try:
+                    import pyarrow as pa
+                    buf = pa.ipc.serialize_pandas(df).to_pybytes()
+                except Exception:
+                    # Frames pyarrow can't round-trip stay live.
+                    continue
+
+                with self._lock:
+                    entry = self.cache.get(id)
+                    if entry is None or entry["df_compressed"]:
+                        continue
+                    if entry["fields"].get("df") is not df:
+                        # Replaced or touched while we were serializing.
+                        continue
+                    if time.monotonic() - entry["last_access"] < self.compact_after:
+                        continue
+                    entry["fields"]["df"] = buf
+                    entry["df_compressed"] = True
+                    entry["sizes"]["df"] = len(buf)
+                    entry["size_bytes"] = sum(entry["sizes"].values())
+
+    def append_history(self, id, question):
+        # deque appends are thread-safe and O(1); maxlen bounds the
+        # history so the endpoint response can't grow without limit.
+        # One row per id: normalized repeat asks share an id and would
+        # otherwise fill the history with duplicates.
+        if any(item["id"] == id for item in self._history):
+            return
 
-        if field not in self.cache[id]:
-            return None
+        self._history.append({"id": id, "question": question})
 
-        return self.cache[id][field]
+    def get_history(self) -> list:
+        return list(self._history)
 
     def get_all(self, field_list) -> list:
-        return [
-            {
-                "id": id,
-                **{
-                    field: self.get(id=id, field=field)
-                    for field in field_list
+        with self._lock:
+            now = time.monotonic()
+            return [
+                {
+                    "id": id,
+                    **{
+                        field: entry["fields"].get(field)
+                        for field in field_list
+                    }
                 }
-            }
-            for id in self.cache
-        ]
+                for id, entry in self.cache.items()
+                if now < entry["expires_at"]
+            ]
 
     def delete(self, id):
-        if id in self.cache:
-            del self.cache[id]
\ No newline at end of file
+        with self._lock:
+            self.cache.pop(id, None)
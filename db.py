@@ -1,7 +1,6 @@
 import os
-from vanna.remote import VannaDefault
 
-def connect(vn: VannaDefault):
+def connect(vn):
     database_type = os.getenv("DATABASE_TYPE")
 
     if database_type == "snowflake":
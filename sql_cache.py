@@ -0,0 +1,46 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+# Durable question -> sql cache so repeat questions skip the LLM even
+# after a worker restart, when the in-process caches are cold.
+_DB_PATH = os.getenv("SQL_CACHE_PATH", "vn_cache.db")
+_TTL_SECONDS = float(os.getenv("SQL_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+
+_conn = None
+_lock = threading.Lock()
+
+def _connect():
+    global _conn
+
+    if _conn is None:
+        _conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        _conn.execute("CREATE TABLE IF NOT EXISTS qcache (qhash TEXT PRIMARY KEY, sql TEXT, ts INTEGER)")
+        _conn.commit()
+
+    return _conn
+
+def _qhash(question: str) -> str:
+    return hashlib.blake2b(question.encode(), digest_size=16).hexdigest()
+
+def lookup(question: str):
+    with _lock:
+        row = _connect().execute(
+            "SELECT sql, ts FROM qcache WHERE qhash = ?", (_qhash(question),)
+        ).fetchone()
+
+    if row is None or time.time() - row[1] >= _TTL_SECONDS:
+        return None
+
+    return row[0]
+
+def store(question: str, sql: str):
+    with _lock:
+        conn = _connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO qcache VALUES (?, ?, ?)",
+            (_qhash(question), sql, int(time.time())),
+        )
+        conn.commit()